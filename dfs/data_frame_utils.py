@@ -14,7 +14,8 @@ def contains_all_columns(df: pd.DataFrame, columns: Sequence[str]) -> bool:
     """
     if df is None or columns is None:
         raise ValueError("Data frame and columns must not be None")
-    return all([x in df.columns for x in columns])
+    df_columns = set(df.columns)
+    return all(x in df_columns for x in columns)
 
 
 def col_contains_all_values(df: pd.DataFrame, col: str, values: Iterable[Any]) -> bool:
@@ -29,7 +30,8 @@ def col_contains_all_values(df: pd.DataFrame, col: str, values: Iterable[Any]) -
     """
     if col is None or col not in df.columns:
         raise ValueError(f"The column, {col}, must be found in data frame")
-    return all(val in df[col].unique() for val in values)
+    unique_values = set(df[col].unique().tolist())
+    return not (set(values) - unique_values)
 
 
 def map_index_to_col(df: pd.DataFrame, col: str) -> Dict[Any, Any]:
@@ -45,7 +47,7 @@ def map_index_to_col(df: pd.DataFrame, col: str) -> Dict[Any, Any]:
         raise ValueError('Data frame cannot be None')
     if col is None or col not in df.columns:
         raise ValueError('The column must not be None and must be found in the data frame')
-    return {i: df.loc[i][col] for i in df.index}
+    return dict(zip(df.index, df[col]))
 
 
 def merge_dicts(*args: Dict) -> Dict[Any, Any]:
@@ -56,10 +58,15 @@ def merge_dicts(*args: Dict) -> Dict[Any, Any]:
     :return: The merged dict.
     :raises: A ValueError if no non-none dicts are passed.
     """
-    dicts = list(filter(lambda x: x is not None, args))
-    if len(dicts) == 0:
+    merged = {}
+    any_merged = False
+    for d in args:
+        if d is not None:
+            merged.update(d)
+            any_merged = True
+    if not any_merged:
         raise ValueError('No valid dicts to merge')
-    return {k: v for d in dicts for k, v in d.items()}
+    return merged
 
 
 def map_cols_and_filter_by_values(df: pd.DataFrame, column_mapping: Dict[str, str]) -> pd.DataFrame:
@@ -73,5 +80,6 @@ def map_cols_and_filter_by_values(df: pd.DataFrame, column_mapping: Dict[str, st
     """
     if df is None or column_mapping is None:
         raise ValueError('Data frame and column mapping arguments must not be none')
+    columns = list(column_mapping.values())
     df.rename(columns=column_mapping, inplace=True)
-    return df[column_mapping.values()]
+    return df[columns]
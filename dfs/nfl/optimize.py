@@ -33,7 +33,7 @@ class NflLineupOptimizer(LineupOptimizer, metaclass=ABCMeta):
         :return: None
         :raises: ValueError if team name is invalid
         """
-        if team not in self._data[self._team_col].unique():
+        if team not in self._get_column_values(self._team_col):
             raise ValueError('Invalid team name')
         if position is not None and num_receivers is not None:  # TODO: should this be supported?
             raise ValueError('Both of "position" and "num_receivers" cannot be provided')
@@ -56,7 +56,7 @@ class NflLineupOptimizer(LineupOptimizer, metaclass=ABCMeta):
         :return: None
         :raises: ValueError if team name is invalid
         """
-        if team is None or team not in self._data[self._team_col].unique():
+        if team is None or team not in self._get_column_values(self._team_col):
             raise ValueError('Invalid team name')
         self._add_constraint(nfl_constraints.RbDstStackConstraint(team=team,
                                                                   team_col=self._team_col,
@@ -1,8 +1,11 @@
 import csv
 import logging
+import operator
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Tuple, Union
+from collections import Counter
+from typing import Any, Dict, List, Set, Tuple, Union
 
+import numpy as np
 import pandas as pd
 from pulp import LpMaximize, LpProblem, LpVariable, lpSum, PULP_CBC_CMD
 
@@ -16,6 +19,10 @@ from dfs.slate import GameSlate
 logger = logging.getLogger(__name__)
 logger.addHandler(logging.NullHandler())
 
+# lineup player fields written to CSV, in the same (alphabetical) order previously produced by dir()
+_LINEUP_FIELDS = ('datetime', 'name', 'opponent', 'points', 'position', 'salary', 'team')
+_LINEUP_GET = operator.attrgetter(*_LINEUP_FIELDS)
+
 
 class OptimizedLineup:
     """
@@ -28,7 +35,10 @@ class OptimizedLineup:
         :param site: The fantasy site that the lineup has been generated for.
         """
         self.site = site
-        players = optimizer.data[optimizer.data.apply(lambda x: x['LpVariable'].varValue == 1, axis=1)]
+        var_values = np.fromiter((v.varValue for v in optimizer.data['LpVariable'].values),
+                                 dtype=np.float64,
+                                 count=len(optimizer.data))
+        players = optimizer.data.loc[var_values == 1]
         self.points = round(players[optimizer.points_col].sum(), 2)
         self.salary = players[optimizer.salary_col].sum()
         col_mapping = {
@@ -41,30 +51,20 @@ class OptimizedLineup:
             optimizer.salary_col: 'salary',
             optimizer.datetime_col: 'datetime'
         }
-        players_dict = players.to_dict('records')
-        position_to_count = dict()
-        for p in players_dict:
-            for k, v in col_mapping.items():
-                if k is not None:  # id_col may be None
-                    p[v] = p.pop(k)
-            keys_to_delete = []
-            for k in p.keys():
-                if k not in col_mapping.values():
-                    keys_to_delete.append(k)
-            for k in keys_to_delete:
-                del p[k]
-            if p['position'] in position_to_count:
-                position_to_count[p['position']] = position_to_count[p['position']] + 1
-            else:
-                position_to_count[p['position']] = 1
-        self.players = [LineupPlayer(p) for p in players_dict]
+        col_mapping = {k: v for k, v in col_mapping.items() if k is not None}  # id_col may be None
+        players = players[list(col_mapping.keys())].rename(columns=col_mapping)
+        position_to_count = Counter(players['position'])
+        player_cols = ['name', 'position', 'team', 'opponent', 'points', 'salary', 'datetime']
+        self.players = [LineupPlayer(*p) for p in players[player_cols].itertuples(index=False, name=None)]
+        position_constraints = optimizer._get_position_constraints()
         for position in (RB, WR, TE):
-            _, maximum = optimizer.position_constraints()[position]
+            _, maximum = position_constraints[position]
             if position_to_count[position] == maximum:
                 logger.info(f"Flex position for this lineup is filled by {position}")
-                players_for_position = list(sorted(filter(lambda player: player.position == position, self.players),
-                                                   key=lambda x: x.datetime))
-                players_for_position[-1].lineup_position = FLEX
+                # reversed so that ties resolve to the last matching player, as the previous stable sort did
+                latest = max((p for p in reversed(self.players) if p.position == position),
+                             key=operator.attrgetter('datetime'))
+                latest.lineup_position = FLEX
                 break
         self.players = sorted(self.players, key=lambda x: optimizer.player_order_dict()[x.lineup_position])
 
@@ -83,10 +83,10 @@ class OptimizedLineup:
             raise ValueError(f"Only CSV output is supported, found: {extension}")
         file_exists = file_utils.file_exists(file_path)
         with open(file_path, mode='a') as f:
-            writer = csv.DictWriter(f, fieldnames=dir(self.players[0]))
+            writer = csv.DictWriter(f, fieldnames=_LINEUP_FIELDS)
             if not file_exists:
                 writer.writeheader()
-            writer.writerows([{k: player.__getattribute__(k) for k in dir(player)} for player in self.players])
+            writer.writerows(dict(zip(_LINEUP_FIELDS, _LINEUP_GET(p))) for p in self.players)
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -116,20 +116,28 @@ class LineupPlayer:
     A model of a player included in an optimized lineup.
     """
 
-    def __init__(self, player_dict: dict):
+    __slots__ = ('name', 'position', 'lineup_position', 'team', 'opponent', 'points', 'salary', 'datetime')
+
+    def __init__(self, name: str, position: str, team: str, opponent: str, points: float, salary: float, datetime: Any):
         """
-        Initializer.
+        Initializer. The player's lineup position defaults to their position.
 
-        :param player_dict: the player dict corresponding to a row from the dataframe.
+        :param name: the player's name.
+        :param position: the player's position.
+        :param team: the player's team.
+        :param opponent: the player's opponent.
+        :param points: the player's fantasy points.
+        :param salary: the player's salary.
+        :param datetime: the datetime of the player's game.
         """
-        self.name = player_dict['name']
-        self.position = player_dict['position']
-        self.lineup_position = player_dict['position']
-        self.team = player_dict['team']
-        self.opponent = player_dict['opponent']
-        self.points = player_dict['points']
-        self.salary = player_dict['salary']
-        self.datetime = player_dict['datetime']
+        self.name = name
+        self.position = position
+        self.lineup_position = position
+        self.team = team
+        self.opponent = opponent
+        self.points = points
+        self.salary = salary
+        self.datetime = datetime
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -176,7 +184,8 @@ class LineupOptimizer(ABC):
                  team_col: str = 'team',
                  opponent_col: str = 'opponent',
                  datetime_col: str = 'datetime',
-                 id_col: str = None):
+                 id_col: str = None,
+                 copy: bool = True):
         """
         :param data_source: A dataframe or file path containing fantasy data.
         :param name_col: The player name column. Default is 'name'.
@@ -189,9 +198,11 @@ class LineupOptimizer(ABC):
         :param opponent_col: The player opponent column. Default is 'opponent'.
         :param datetime_col: The datetime column. Default is 'datetime'.
         :param id_col: Optional ID column name.
+        :param copy: Whether to copy a provided data frame. Default is True. When False, the caller's data frame has its
+            position column normalized and rows containing NaN values dropped in place.
         """
         if type(data_source) is pd.DataFrame:
-            self._data = data_source.copy()  # don't impact original dataframe
+            self._data = data_source.copy() if copy else data_source  # by default, don't impact original dataframe
         elif type(data_source) is str:
             if not file_utils.file_exists(file=data_source):
                 raise ValueError('The data source file does not exist!')
@@ -215,7 +226,7 @@ class LineupOptimizer(ABC):
                                                      datetime_col]):
             raise InvalidDataFrameException('DataFrame does not contain necessary columns')
         if id_col is not None:
-            if len(self._data[id_col].unique()) != len(self._data):
+            if not self._data[id_col].is_unique:
                 raise InvalidDataFrameException('Provided ID column must be unique for each row')
         self._name_col = name_col
         self._year_col = year_col
@@ -228,7 +239,16 @@ class LineupOptimizer(ABC):
         self._datetime_col = datetime_col
         self._id_col = id_col
         self._constraints = []
-        self._data[self._position_col] = self._data[self._position_col].apply(lambda x: normalize_position(x))
+        self._position_constraints = None  # site constants below are lazily cached by their _get_* methods
+        self._num_players = None
+        self._salary_cap = None
+        self._problem = None  # lineup problem without objective, reused until constraints or non-points data change
+        self._problem_data = None
+        self._column_values = {}  # column name to set of unique values, used to validate constraint arguments
+        self._lp_vars = None
+        positions = self._data[self._position_col]
+        normalized_positions = {p: normalize_position(p) for p in positions.dropna().unique()}
+        self._data[self._position_col] = positions.map(normalized_positions)
         self._data.dropna(inplace=True)
         self._data = self._data[self._data[self._salary_col] > 0]
 
@@ -322,6 +342,37 @@ class LineupOptimizer(ABC):
         """
         raise NotImplementedError
 
+    def _get_num_players(self) -> int:
+        """
+        Internal method that returns the site's lineup size, calling num_players() only on first use.
+
+        :return: The total number of players to be included in the lineup.
+        """
+        if self._num_players is None:
+            self._num_players = self.num_players()
+        return self._num_players
+
+    def _get_salary_cap(self) -> int:
+        """
+        Internal method that returns the site's salary cap, calling salary_cap() only on first use.
+
+        :return: The site's salary cap.
+        """
+        if self._salary_cap is None:
+            self._salary_cap = self.salary_cap()
+        return self._salary_cap
+
+    def _get_position_constraints(self) -> Dict[str, Tuple[int, int]]:
+        """
+        Internal method that returns the site's position constraints, calling position_constraints() only on first use.
+        A copy is returned so that callers cannot change the cached constraints.
+
+        :return: A dict mapping position name to min/max count.
+        """
+        if self._position_constraints is None:
+            self._position_constraints = self.position_constraints()
+        return dict(self._position_constraints)
+
     def set_only_include_teams(self, teams: List[str]) -> None:
         """
         Sets the teams that are to be considered for the lineup optimization.
@@ -371,7 +422,7 @@ class LineupOptimizer(ABC):
         if 'id' in kwargs and self._id_col is None:
             raise ValueError('ID column not specified')
         key, col = (kwargs['id'], self._id_col) if 'id' in kwargs else (kwargs['name'], self.name_col)
-        if key is None or key not in self._data[col].unique():
+        if key is None or key not in self._get_column_values(col):
             raise ValueError(f"{key} not found in data frame's {col} column")
         self._add_constraint(constraints.IncludePlayerConstraint(player=key,
                                                                  name_col=col))
@@ -388,7 +439,7 @@ class LineupOptimizer(ABC):
         if 'id' in kwargs and self._id_col is None:
             raise ValueError('ID column not specified')
         key, col = (kwargs['id'], self._id_col) if 'id' in kwargs else (kwargs['name'], self.name_col)
-        if key is None or key not in self._data[col].unique():
+        if key is None or key not in self._get_column_values(col):
             raise ValueError(f"{key} not found in data frame's {col} column")
         self._add_constraint(constraints.ExcludePlayerConstraint(player=key,
                                                                  name_col=col))
@@ -402,9 +453,9 @@ class LineupOptimizer(ABC):
         :return: None
         :raises: ValueError if number of players or team are invalid
         """
-        if n is None or n > self.num_players():
+        if n is None or n > self._get_num_players():
             raise ValueError('Invalid number of players')
-        if team is None or team not in self._data[self._team_col].unique():
+        if team is None or team not in self._get_column_values(self._team_col):
             raise ValueError('Invalid team name')
         self._add_constraint(constraints.MaxPlayersFromTeamConstraint(maximum=n,
                                                                       team=team,
@@ -428,7 +479,7 @@ class LineupOptimizer(ABC):
         """
         if n is None or n < 0:
             raise ValueError('Invalid maximum players')
-        if team is None or team not in self._data[self._team_col].unique():
+        if team is None or team not in self._get_column_values(self._team_col):
             raise ValueError('Invalid team name')
         self._add_constraint(constraints.MaxPlayersFromTeamConstraint(maximum=n,
                                                                       team=team,
@@ -443,9 +494,9 @@ class LineupOptimizer(ABC):
         :return: None
         :raises: ValueError if minimum or team are invalid
         """
-        if n is None or n > self.num_players():
+        if n is None or n > self._get_num_players():
             raise ValueError('Invalid minimum number of players')
-        if team is None or team not in self._data[self._team_col].unique():
+        if team is None or team not in self._get_column_values(self._team_col):
             raise ValueError('Invalid team name')
         if n == 0:
             return
@@ -474,7 +525,7 @@ class LineupOptimizer(ABC):
         :return: None
         :raises: ValueError if minimum is invalid
         """
-        if n is None or n > self.salary_cap():
+        if n is None or n > self._get_salary_cap():
             raise ValueError('Invalid minimum')
         self._add_constraint(constraints.MinSalaryCapConstraint(salary=n,
                                                                 salary_col=self._salary_col))
@@ -490,7 +541,7 @@ class LineupOptimizer(ABC):
         self._add_constraint(constraints.GameSlateConstraint(slate=slate,
                                                              datetime_col=self._datetime_col,
                                                              week_col=self.week_col,
-                                                             num_players=self.num_players()))
+                                                             num_players=self._get_num_players()))
 
     def _add_constraint(self, constraint: constraints.LineupConstraint) -> None:
         """
@@ -503,6 +554,7 @@ class LineupOptimizer(ABC):
         is_valid, message = constraint.is_valid(self._constraints)
         if is_valid:
             self._constraints.append(constraint)
+            self._problem = None
         else:
             raise InvalidConstraintException(f"Invalid constraint: {message}")
 
@@ -513,32 +565,90 @@ class LineupOptimizer(ABC):
         :return: None
         """
         self._constraints = []
+        self._problem = None
 
-    def optimize_lineup(self) -> OptimizedLineup:
+    def _problem_columns_data(self) -> pd.DataFrame:
         """
-        Generates and returns an optimized lineup for a given fantasy football site.
-        The lineup is generated using the class's data variable and is optimized under provided constraints.
+        Internal method that returns the data frame restricted to the configured columns that lineup problem
+        constraints are built from, i.e. every configured column except points.
 
-        :return: The optimized lineup.
-        :raises: ValueError, InvalidDataFrameException
+        :return: The data frame of constraint columns.
         """
-        position_constraints = self.position_constraints()
+        cols = [self._id_col, self._name_col, self._position_col, self._year_col, self._week_col, self._salary_col,
+                self._team_col, self._opponent_col, self._datetime_col]
+        return self._data[[c for c in cols if c is not None]]
+
+    def _refresh_data_snapshot(self) -> None:
+        """
+        Internal method that drops the cached problem and column values if any constraint column of the optimizer's
+        data has changed since they were cached.
+
+        :return: None
+        """
+        data = self._problem_columns_data()
+        if self._problem_data is None or not data.equals(self._problem_data):
+            self._problem = None
+            self._column_values = {}
+            self._problem_data = data.copy()
+
+    def _get_column_values(self, col: str) -> Set[Any]:
+        """
+        Internal method that returns the set of unique values in one of the data's columns, reflecting the current data.
+
+        :param col: The column name.
+        :return: The set of unique column values.
+        """
+        self._refresh_data_snapshot()
+        if col not in self._column_values:
+            self._column_values[col] = set(self._data[col].unique().tolist())
+        return self._column_values[col]
+
+    def _build_problem(self) -> None:
+        """
+        Internal method that builds the lineup problem's variables and constraints, without an objective, and caches it
+        so that subsequent optimizations only need to set a new objective.
+
+        :return: None
+        :raises: InvalidDataFrameException if the data frame is missing required positions
+        """
+        position_constraints = self._get_position_constraints()
         if not data_frame_utils.col_contains_all_values(self._data, self.position_col, position_constraints.keys()):
             raise InvalidDataFrameException('Data frame is missing required positions')
-        self._data['LpVariable'] = self._data.apply(lambda x: LpVariable(f"{x[self._position_col]}_{x.name}",
-                                                                         cat='Binary'), axis=1)
+        positions = self._data[self._position_col].to_numpy()
+        indices = self._data.index.to_numpy()
+        self._data['LpVariable'] = [LpVariable(f"{p}_{i}", cat='Binary') for p, i in zip(positions, indices)]
+        position_to_vars = {k: g.to_numpy()
+                            for k, g in self._data.groupby(self._position_col, sort=False)['LpVariable']}
         problem = LpProblem(f"{self.site_name()}LineupOptimization", LpMaximize)
         for k, v in position_constraints.items():
-            players = self._data[self._data[self._position_col] == k]
-            problem += lpSum(players['LpVariable']) >= v[0]
-            problem += lpSum(players['LpVariable']) <= v[1]
-        problem += lpSum(self._data[self._points_col] * self._data['LpVariable'])
-        problem += constraints.LineupSizeConstraint(self.num_players()).apply(self._data)[0]
-        problem += constraints.MaxSalaryCapConstraint(self.salary_cap(), self._salary_col).apply(self._data)[0]
+            problem += lpSum(position_to_vars[k]) >= v[0]
+            problem += lpSum(position_to_vars[k]) <= v[1]
+        problem += constraints.LineupSizeConstraint(self._get_num_players()).apply(self._data)[0]
+        problem += constraints.MaxSalaryCapConstraint(self._get_salary_cap(), self._salary_col).apply(self._data)[0]
         for constraint in self._constraints:
             for c in constraint.apply(self._data):  # stack-related constraints may return multiple from apply()
                 problem += c
-        problem.solve(PULP_CBC_CMD(msg=False))
-        if not pulp_utils.is_optimal_solution_found(problem):
+        self._problem = problem
+        self._lp_vars = self._data['LpVariable'].to_numpy()
+
+    def optimize_lineup(self) -> OptimizedLineup:
+        """
+        Generates and returns an optimized lineup for a given fantasy football site.
+        The lineup is generated using the class's data variable and is optimized under provided constraints.
+        The underlying problem is reused across calls, so that edits to the points column of the optimizer's data
+        only rebuild the objective. Adding or clearing constraints, or editing rows or any other configured column
+        (ex. salary, position or team), rebuilds the whole problem. Constraint setters validate teams, names and ids
+        against the current data as well.
+
+        :return: The optimized lineup.
+        :raises: ValueError, InvalidDataFrameException
+        """
+        self._refresh_data_snapshot()
+        if self._problem is None:
+            self._build_problem()
+        points = self._data[self._points_col].to_numpy()
+        self._problem.setObjective(lpSum(points * self._lp_vars))
+        self._problem.solve(PULP_CBC_CMD(msg=False))
+        if not pulp_utils.is_optimal_solution_found(self._problem):
             raise UnsolvableLineupException('No optimal solution found under current lineup constraints')
         return OptimizedLineup(self, self.site_name())
@@ -29,6 +29,10 @@ class TestNflLineupOptimizer(ABC):
     def test_optimize_with_excel_file(self):
         pass
 
+    @abstractmethod
+    def test_optimize_without_copy(self):
+        pass
+
     @abstractmethod
     def test_optimizer_setting_missing_column(self):
         pass
@@ -77,6 +81,22 @@ class TestNflLineupOptimizer(ABC):
     def test_clear_constraints(self):
         pass
 
+    @abstractmethod
+    def test_optimize_after_points_update(self):
+        pass
+
+    @abstractmethod
+    def test_optimize_after_salary_update(self):
+        pass
+
+    @abstractmethod
+    def test_optimize_after_constraint_changes(self):
+        pass
+
+    @abstractmethod
+    def test_team_constraint_after_team_update(self):
+        pass
+
     @abstractmethod
     def test_must_include_team(self):
         pass
@@ -410,6 +430,24 @@ class TestDraftKingsNflLineupOptimizer(unittest.TestCase, TestNflLineupOptimizer
         self.assertEqual(49100, lineup.salary)
         temp.close()
 
+    def test_optimize_without_copy(self):
+        df = self.data[self.data['week'] == 1].copy()
+        df['position'] = df['position'].str.lower()
+        original = df.copy()
+        DraftKingsNflLineupOptimizer(data_source=df,
+                                     points_col='dk_points',
+                                     salary_col='dk_salary')
+        self.assertTrue(df.equals(original))  # default copy leaves the caller's data frame untouched
+        optimizer = DraftKingsNflLineupOptimizer(data_source=df,
+                                                 points_col='dk_points',
+                                                 salary_col='dk_salary',
+                                                 copy=False)
+        self.assertTrue(df['position'].isin(['QB', 'RB', 'WR', 'TE', 'DST']).all())
+        self.assertLessEqual(len(df), len(original))
+        lineup = optimizer.optimize_lineup()
+        self.assertEqual(288.78, lineup.points)
+        self.assertEqual(49100, lineup.salary)
+
     def test_optimizer_setting_missing_column(self):
         self.assertRaises(InvalidDataFrameException,
                           lambda: DraftKingsNflLineupOptimizer(self.data[self.data['week'] == 1], name_col='missing'))
@@ -495,6 +533,55 @@ class TestDraftKingsNflLineupOptimizer(unittest.TestCase, TestNflLineupOptimizer
         lineup = optimizer.optimize_lineup()
         self.assertTrue(all([t in [x.team for x in lineup.players] for t in teams]))
 
+    def test_optimize_after_points_update(self):
+        optimizer = DraftKingsNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                                 points_col='dk_points',
+                                                 salary_col='dk_salary')
+        lineup = optimizer.optimize_lineup()
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.data.loc[optimizer.data['name'] == name, 'dk_points'] = -100
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+
+    def test_optimize_after_salary_update(self):
+        optimizer = DraftKingsNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                                 points_col='dk_points',
+                                                 salary_col='dk_salary')
+        lineup = optimizer.optimize_lineup()
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.data.loc[optimizer.data['name'] == name, 'dk_salary'] = optimizer.salary_cap()
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+        self.assertLessEqual(lineup.salary, optimizer.salary_cap())
+
+    def test_optimize_after_constraint_changes(self):
+        optimizer = DraftKingsNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                                 points_col='dk_points',
+                                                 salary_col='dk_salary')
+        lineup = optimizer.optimize_lineup()
+        points = lineup.points
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.set_exclude_player(name=name)
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+        self.assertLess(lineup.points, points)
+        optimizer.clear_constraints()
+        lineup = optimizer.optimize_lineup()
+        self.assertEqual(points, lineup.points)
+
+    def test_team_constraint_after_team_update(self):
+        optimizer = DraftKingsNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                                 points_col='dk_points',
+                                                 salary_col='dk_salary')
+        optimizer.set_must_include_team(team='SEA')
+        optimizer.optimize_lineup()
+        optimizer.clear_constraints()
+        optimizer.data.loc[optimizer.data['team'] == 'SEA', 'team'] = 'NEWTEAM'
+        self.assertRaises(ValueError, lambda: optimizer.set_min_players_from_team(n=1, team='SEA'))
+        optimizer.set_min_players_from_team(n=2, team='NEWTEAM')
+        lineup = optimizer.optimize_lineup()
+        self.assertGreaterEqual(len([x for x in lineup.players if x.team == 'NEWTEAM']), 2)
+
     def test_must_include_team(self):
         optimizer = DraftKingsNflLineupOptimizer(self.data[self.data['week'] == 1],
                                                  points_col='dk_points',
@@ -1105,6 +1192,24 @@ class TestFanDuelNflLineupOptimizer(unittest.TestCase, TestNflLineupOptimizer):
         self.assertEqual(59800, lineup.salary)
         temp.close()
 
+    def test_optimize_without_copy(self):
+        df = self.data[self.data['week'] == 1].copy()
+        df['position'] = df['position'].str.lower()
+        original = df.copy()
+        FanDuelNflLineupOptimizer(data_source=df,
+                                  points_col='fd_points',
+                                  salary_col='fd_salary')
+        self.assertTrue(df.equals(original))  # default copy leaves the caller's data frame untouched
+        optimizer = FanDuelNflLineupOptimizer(data_source=df,
+                                              points_col='fd_points',
+                                              salary_col='fd_salary',
+                                              copy=False)
+        self.assertTrue(df['position'].isin(['QB', 'RB', 'WR', 'TE', 'DST']).all())
+        self.assertLessEqual(len(df), len(original))
+        lineup = optimizer.optimize_lineup()
+        self.assertEqual(244.68, lineup.points)
+        self.assertEqual(59800, lineup.salary)
+
     def test_optimizer_setting_missing_column(self):
         self.assertRaises(InvalidDataFrameException,
                           lambda: FanDuelNflLineupOptimizer(self.data[self.data['week'] == 1], name_col='missing'))
@@ -1190,6 +1295,55 @@ class TestFanDuelNflLineupOptimizer(unittest.TestCase, TestNflLineupOptimizer):
         lineup = optimizer.optimize_lineup()
         self.assertTrue(all([t in [x.team for x in lineup.players] for t in teams]))
 
+    def test_optimize_after_points_update(self):
+        optimizer = FanDuelNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                              points_col='fd_points',
+                                              salary_col='fd_salary')
+        lineup = optimizer.optimize_lineup()
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.data.loc[optimizer.data['name'] == name, 'fd_points'] = -100
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+
+    def test_optimize_after_salary_update(self):
+        optimizer = FanDuelNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                              points_col='fd_points',
+                                              salary_col='fd_salary')
+        lineup = optimizer.optimize_lineup()
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.data.loc[optimizer.data['name'] == name, 'fd_salary'] = optimizer.salary_cap()
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+        self.assertLessEqual(lineup.salary, optimizer.salary_cap())
+
+    def test_optimize_after_constraint_changes(self):
+        optimizer = FanDuelNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                              points_col='fd_points',
+                                              salary_col='fd_salary')
+        lineup = optimizer.optimize_lineup()
+        points = lineup.points
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.set_exclude_player(name=name)
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+        self.assertLess(lineup.points, points)
+        optimizer.clear_constraints()
+        lineup = optimizer.optimize_lineup()
+        self.assertEqual(points, lineup.points)
+
+    def test_team_constraint_after_team_update(self):
+        optimizer = FanDuelNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                              points_col='fd_points',
+                                              salary_col='fd_salary')
+        optimizer.set_must_include_team(team='SEA')
+        optimizer.optimize_lineup()
+        optimizer.clear_constraints()
+        optimizer.data.loc[optimizer.data['team'] == 'SEA', 'team'] = 'NEWTEAM'
+        self.assertRaises(ValueError, lambda: optimizer.set_min_players_from_team(n=1, team='SEA'))
+        optimizer.set_min_players_from_team(n=2, team='NEWTEAM')
+        lineup = optimizer.optimize_lineup()
+        self.assertGreaterEqual(len([x for x in lineup.players if x.team == 'NEWTEAM']), 2)
+
     def test_must_include_team(self):
         optimizer = FanDuelNflLineupOptimizer(self.data[self.data['week'] == 1],
                                               points_col='fd_points',
@@ -1799,6 +1953,24 @@ class TestYahooNflLineupOptimizer(unittest.TestCase, TestNflLineupOptimizer):
         self.assertEqual(195, lineup.salary)
         temp.close()
 
+    def test_optimize_without_copy(self):
+        df = self.data[self.data['week'] == 1].copy()
+        df['position'] = df['position'].str.lower()
+        original = df.copy()
+        YahooNflLineupOptimizer(data_source=df,
+                                points_col='yh_points',
+                                salary_col='yh_salary')
+        self.assertTrue(df.equals(original))  # default copy leaves the caller's data frame untouched
+        optimizer = YahooNflLineupOptimizer(data_source=df,
+                                            points_col='yh_points',
+                                            salary_col='yh_salary',
+                                            copy=False)
+        self.assertTrue(df['position'].isin(['QB', 'RB', 'WR', 'TE', 'DST']).all())
+        self.assertLessEqual(len(df), len(original))
+        lineup = optimizer.optimize_lineup()
+        self.assertEqual(244.68, lineup.points)
+        self.assertEqual(195, lineup.salary)
+
     def test_optimizer_setting_missing_column(self):
         self.assertRaises(InvalidDataFrameException,
                           lambda: YahooNflLineupOptimizer(self.data[self.data['week'] == 1], name_col='missing'))
@@ -1883,6 +2055,55 @@ class TestYahooNflLineupOptimizer(unittest.TestCase, TestNflLineupOptimizer):
         lineup = optimizer.optimize_lineup()
         self.assertTrue(all([t in [x.team for x in lineup.players] for t in teams]))
 
+    def test_optimize_after_points_update(self):
+        optimizer = YahooNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                            points_col='yh_points',
+                                            salary_col='yh_salary')
+        lineup = optimizer.optimize_lineup()
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.data.loc[optimizer.data['name'] == name, 'yh_points'] = -100
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+
+    def test_optimize_after_salary_update(self):
+        optimizer = YahooNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                            points_col='yh_points',
+                                            salary_col='yh_salary')
+        lineup = optimizer.optimize_lineup()
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.data.loc[optimizer.data['name'] == name, 'yh_salary'] = optimizer.salary_cap()
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+        self.assertLessEqual(lineup.salary, optimizer.salary_cap())
+
+    def test_optimize_after_constraint_changes(self):
+        optimizer = YahooNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                            points_col='yh_points',
+                                            salary_col='yh_salary')
+        lineup = optimizer.optimize_lineup()
+        points = lineup.points
+        name = max(lineup.players, key=lambda x: x.points).name
+        optimizer.set_exclude_player(name=name)
+        lineup = optimizer.optimize_lineup()
+        self.assertTrue(all([x.name != name for x in lineup.players]))
+        self.assertLess(lineup.points, points)
+        optimizer.clear_constraints()
+        lineup = optimizer.optimize_lineup()
+        self.assertEqual(points, lineup.points)
+
+    def test_team_constraint_after_team_update(self):
+        optimizer = YahooNflLineupOptimizer(self.data[self.data['week'] == 1],
+                                            points_col='yh_points',
+                                            salary_col='yh_salary')
+        optimizer.set_must_include_team(team='SEA')
+        optimizer.optimize_lineup()
+        optimizer.clear_constraints()
+        optimizer.data.loc[optimizer.data['team'] == 'SEA', 'team'] = 'NEWTEAM'
+        self.assertRaises(ValueError, lambda: optimizer.set_min_players_from_team(n=1, team='SEA'))
+        optimizer.set_min_players_from_team(n=2, team='NEWTEAM')
+        lineup = optimizer.optimize_lineup()
+        self.assertGreaterEqual(len([x for x in lineup.players if x.team == 'NEWTEAM']), 2)
+
     def test_must_include_team(self):
         optimizer = YahooNflLineupOptimizer(self.data[self.data['week'] == 1],
                                             points_col='yh_points',
@@ -35,6 +35,13 @@ class TestDataFrameUtils(unittest.TestCase):
     def test_map_index_to_col(self):
         self.assertDictEqual({0: 20.0, 1: 15.9}, data_frame_utils.map_index_to_col(self.df, 'points'))
 
+    def test_map_index_to_col_datetime(self):
+        df = self.df.copy()
+        df['datetime'] = pd.to_datetime(['2020-09-13 13:00:00', '2020-09-13 16:25:00'])
+        mapping = data_frame_utils.map_index_to_col(df, 'datetime')
+        self.assertDictEqual({0: pd.Timestamp('2020-09-13 13:00:00'), 1: pd.Timestamp('2020-09-13 16:25:00')}, mapping)
+        self.assertTrue(all(type(v) is pd.Timestamp for v in mapping.values()))
+
     def test_map_index_to_col_none_data_frame(self):
         self.assertRaises(ValueError, lambda: data_frame_utils.map_index_to_col(None, 'points'))
 
@@ -14,6 +14,7 @@ setuptools.setup(
     url="https://github.com/sullivanja92/dfs",
     packages=['dfs'],
     install_requires=[
+        'numpy',
         'pandas',
         'pulp'
     ],